@@ -1,14 +1,27 @@
 from flask import Flask, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_restx import Api, Resource, fields
-import requests
-from datetime import datetime
-from openai import OpenAI
+from collections import OrderedDict
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, NotFoundError
+import httpx
+import aiohttp
+import fastjsonschema
+from pydantic import BaseModel, ConfigDict
 import logging
-import json
+import asyncio
+import orjson
 import os
+import hmac
 from secrets_manager import get_service_secrets
+import llm_cache
+from json_provider import OrjsonProvider, output_json
+import async_runtime
+import profile_worker
+import openai_http
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -16,8 +29,14 @@ logging.basicConfig(level=logging.INFO,
                    datefmt='%Y-%m-%d %H:%M:%S')
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# Compress larger responses for clients that send Accept-Encoding
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
 # Configure API
 api = Api(app,
     version='1.0',
@@ -26,6 +45,8 @@ api = Api(app,
     doc='/docs'
 )
 
+api.representations['application/json'] = output_json
+
 # Configure namespace
 ns = api.namespace('api', description='Profile operations')
 
@@ -42,14 +63,55 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 QUERY_API_URL = secrets.get('QUERY_API_URL')
 
 API_KEY = secrets.get('API_KEY')
+API_KEY_BYTES = (API_KEY or '').encode('utf-8')
+
+# Static headers for the query service, built once
+QUERY_API_HEADERS = {'X-API-KEY': API_KEY}
+QUERY_API_MAX_RETRIES = 3
+QUERY_API_BACKOFF_FACTOR = 0.3
+QUERY_API_RETRY_STATUSES = (502, 503, 504)
+# Per-attempt limit so a hung connection is retried like a refused one
+QUERY_API_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# Per-request deadlines for work submitted to the async runtime. The generation
+# deadline also caps the worker pool's retries; /api/ais answers 504 past it.
+UPSTREAM_TIMEOUT = 60
+GENERATION_TIMEOUT = 180
 
 OPENAI_API_KEY = secrets.get('OPENAI_API_KEY')
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Initialize OpenAI clients; calls run on the shared async runtime loop.
+# The SDK client serves file/batch calls, single generations go over aiohttp.
+client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    timeout=httpx.Timeout(60.0, connect=5.0),
+    max_retries=2,
+    http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(max_connections=200, max_keepalive_connections=100))
+)
+chat_client = openai_http.ChatCompletionsClient(OPENAI_API_KEY)
+PROFILE_MODEL = "gpt-4o"
+
+# Bounded worker pool for single-profile generations. The OpenAI limits are
+# account-wide, so each gunicorn worker process gets an equal share of them.
+WORKER_PROCESSES = int(os.environ.get('GUNICORN_WORKERS', 1))
+profile_pool = profile_worker.ProfileWorkerPool(
+    chat_client.create,
+    max_concurrency=max(1, int(secrets.get('OPENAI_MAX_CONCURRENCY', profile_worker.DEFAULT_MAX_CONCURRENCY)) // WORKER_PROCESSES),
+    requests_per_minute=max(1, int(secrets.get('OPENAI_RPM', profile_worker.DEFAULT_REQUESTS_PER_MINUTE)) // WORKER_PROCESSES),
+    retry_on=(openai_http.OpenAIRetryableError, aiohttp.ClientError, asyncio.TimeoutError)
+)
+
+# Cache generated profiles; falls back to in-memory when REDIS_URL is unset
+llm_cache.init_cache(secrets.get('REDIS_URL'))
 
 db = SQLAlchemy(app)
 
+# SQLAlchemy's pymysql dialect enables CLIENT.FOUND_ROWS, which the ORM relies on but
+# which makes an upsert that leaves the row unchanged report 1 row like an insert.
+# The create-or-update upserts run on this separate engine without the flag, so they
+# see 1 for an insert and 0 or 2 for an update; the shared engine keeps it.
+upsert_engine = create_engine(SQLALCHEMY_DATABASE_URI, connect_args={'client_flag': 0}, pool_pre_ping=True)
+
 # Models
 class User(db.Model):
     __tablename__ = 'users'
@@ -59,10 +121,11 @@ class User(db.Model):
     bio = db.Column(db.Text)
     location = db.Column(db.String(255))
     profile_pic_url = db.Column(db.String(512))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
 
 class AI(db.Model):
     __tablename__ = 'ais'
+    __table_args__ = (db.UniqueConstraint('content_id', name='uq_ais_content_id'),)
     ai_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     content_id = db.Column(db.Integer, nullable=False)
     display_name = db.Column(db.String(255))
@@ -71,21 +134,83 @@ class AI(db.Model):
     profile_pic_url = db.Column(db.String(512))
     location = db.Column(db.String(255))
     systems_instructions = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
 
-def generate_ai_profile(content, correlation_id=None):    
-    """Generate AI profile using GPT"""
-    prompt = f"""
-Based on the following content information, create a detailed social media profile for an AI agent that embodies the author's persona in the context of their work.
+class AIBatch(db.Model):
+    __tablename__ = 'ai_batches'
+    batch_id = db.Column(db.String(64), primary_key=True)
+    ingested_at = db.Column(db.DateTime, server_default=func.now(), nullable=False)
 
-Content Details:
-Title: {content.get('title', 'Unknown')}
-Author: {content.get('author', 'Unknown')}
-Topic: {content.get('topic', 'Unknown')}
-Genre: {content.get('genre', 'Unknown')}
+USER_FIELDS = ('display_name', 'name', 'bio', 'location', 'profile_pic_url')
+AI_PROFILE_FIELDS = ('display_name', 'name', 'bio', 'location', 'systems_instructions')
 
-Take into account the following custom prompt:
-Custom Prompt: {content.get('custom_prompt', 'None')}
+# Column-only selects for the read paths skip ORM entity construction; the
+# orjson representation serializes created_at to ISO 8601 directly
+USER_PROFILE_QUERY = select(
+    User.user_id, User.display_name, User.name, User.bio, User.location,
+    User.profile_pic_url, User.created_at
+)
+AI_PROFILE_QUERY = select(
+    AI.ai_id, AI.content_id, AI.display_name, AI.name, AI.bio, AI.location,
+    AI.profile_pic_url, AI.systems_instructions, AI.created_at
+)
+
+# content_id -> (etag, content) for conditional requests to the query service.
+# Only touched from the async runtime loop, so no locking is needed.
+content_cache = OrderedDict()
+CONTENT_CACHE_MAX_SIZE = 1024
+
+async def fetch_content(content_id, correlation_id=None):
+    """Fetch content details from the query service"""
+    headers = QUERY_API_HEADERS
+    if correlation_id:
+        headers = {**QUERY_API_HEADERS, 'X-Correlation-ID': correlation_id}
+
+    cached = content_cache.get(content_id)
+    if cached:
+        headers = {**headers, 'If-None-Match': cached[0]}
+
+    session = await async_runtime.get_http_session()
+    for attempt in range(QUERY_API_MAX_RETRIES + 1):
+        last_attempt = attempt == QUERY_API_MAX_RETRIES
+        try:
+            async with session.get(
+                f'{QUERY_API_URL}/api/content/{content_id}',
+                headers=headers,
+                timeout=QUERY_API_TIMEOUT
+            ) as response:
+                if response.status not in QUERY_API_RETRY_STATUSES or last_attempt:
+                    return await _read_content_response(content_id, response, cached)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        await asyncio.sleep(QUERY_API_BACKOFF_FACTOR * 2 ** attempt)
+
+async def _read_content_response(content_id, response, cached):
+    if response.status == 304 and cached:
+        content_cache.move_to_end(content_id)
+        return cached[1]
+    if response.status != 200:
+        content_cache.pop(content_id, None)
+        return None
+
+    content = await response.json(loads=orjson.loads)
+    etag = response.headers.get('ETag')
+    if etag:
+        content_cache[content_id] = (etag, content)
+        content_cache.move_to_end(content_id)
+        while len(content_cache) > CONTENT_CACHE_MAX_SIZE:
+            content_cache.popitem(last=False)
+    return content
+
+# Stable instructions come first so OpenAI's prefix cache could reuse them across
+# calls; bump PROMPT_VERSION whenever the prefix changes. OpenAI only caches prompts
+# of 1024+ tokens and this prefix plus the system message is about 400, so today
+# no request is served from the prompt cache and there is no latency or billing gain.
+PROMPT_VERSION = "profile-v2"
+PROMPT_CACHE_BUCKETS = 256
+PROMPT_PREFIX = """
+Based on the content information given at the end of this message, create a detailed social media profile for an AI agent that embodies the author's persona in the context of their work.
 
 Make all of the below clever, witty, and engaging.
 
@@ -102,15 +227,87 @@ Then create a profile that includes:
 4. A location related to the author or their work (make it something unique/funny)
 5. Detailed system instructions for how this AI should communicate. Describe the tone, style, and personality of the author. Take on the persona of the author and describe to the AI how it should act. E.g. "You are Julius Caesar in his writing of De Bello Gallico, your verbiage is precise and to the point, and you are detailed in your descriptions of military strategy. etc etc"
 
-Please respond in JSON format with the following structure:
-{{
-    "display_name": "Creative display name",
-    "name": "Full name",
-    "bio": "Detailed biography",
-    "location": "Relevant location",
-    "systems_instructions": "Detailed instructions for AI communication style"
-}}
+Respond with the profile fields display_name, name, bio, location and systems_instructions.
+"""
+
+# Only the trailing content details vary per request
+PROMPT_TEMPLATE = PROMPT_PREFIX + """
+Content Details:
+Title: {title}
+Author: {author}
+Topic: {topic}
+Genre: {genre}
+
+Take into account the following custom prompt:
+Custom Prompt: {custom_prompt}
 """
+PROMPT_DEFAULTS = {
+    'title': 'Unknown',
+    'author': 'Unknown',
+    'topic': 'Unknown',
+    'genre': 'Unknown',
+    'custom_prompt': 'None'
+}
+
+class ProfileSchema(BaseModel):
+    """Structured output schema for generated AI profiles"""
+    model_config = ConfigDict(extra='forbid')
+
+    display_name: str
+    name: str
+    bio: str
+    location: str
+    systems_instructions: str
+
+PROFILE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ai_profile",
+        "strict": True,
+        "schema": ProfileSchema.model_json_schema()
+    }
+}
+
+def build_profile_messages(content):
+    """Build the chat messages used to generate an AI profile"""
+    prompt = PROMPT_TEMPLATE.format_map({**PROMPT_DEFAULTS, **content})
+    return [
+        {"role": "system", "content": "You are a profile creation specialist."},
+        {"role": "user", "content": prompt}
+    ]
+
+def prompt_cache_key(content_id):
+    """Provider-side prompt cache routing key for a content item.
+
+    Requests are spread over buckets because a single prefix/key pair above roughly
+    15 RPM overflows to other machines, which lowers the cache hit rate.
+    """
+    return f"{PROMPT_VERSION}-{content_id % PROMPT_CACHE_BUCKETS}"
+
+def parse_profile_response(message):
+    """Validate the structured profile out of a chat completion message"""
+    if message.get('refusal'):
+        raise ValueError(f"Model refused to generate profile: {message['refusal']}")
+    return ProfileSchema.model_validate_json(message['content']).model_dump()
+
+def get_ai_profile(content_id, content, correlation_id=None):
+    """Return the cached AI profile for content, generating it on a miss.
+
+    Runs in the request thread so the blocking Redis calls stay off the async runtime loop.
+    """
+    cache_key = llm_cache.cache_key(PROFILE_MODEL, content, PROMPT_VERSION)
+    cached_profile = llm_cache.get_cached(cache_key)
+    if cached_profile:
+        logging.info(f"Using cached AI profile for content: {content.get('title', 'Unknown')}")
+        return cached_profile
+
+    profile_data = async_runtime.run(generate_ai_profile(content_id, content, correlation_id), GENERATION_TIMEOUT)
+    if profile_data:
+        llm_cache.set_cached(cache_key, profile_data)
+    return profile_data
+
+async def generate_ai_profile(content_id, content, correlation_id=None):
+    """Generate AI profile using GPT"""
     logging.info(f"Generating AI profile for content: {content.get('title', 'Unknown')}")
 
     try:
@@ -118,25 +315,85 @@ Please respond in JSON format with the following structure:
         if correlation_id:
             headers['X-Correlation-ID'] = correlation_id
 
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a profile creation specialist."},
-                {"role": "user", "content": prompt}
-            ]
+        response = await profile_pool.submit(
+            model=PROFILE_MODEL,
+            messages=build_profile_messages(content),
+            prompt_cache_key=prompt_cache_key(content_id),
+            response_format=PROFILE_RESPONSE_FORMAT
         )
 
-        logging.debug(f"OpenAI response: {response.choices[0].message.content}")
+        message = response['choices'][0]['message']
+        logging.debug(f"OpenAI response: {message.get('content')}")
         
-        response_text = response.choices[0].message.content
-        response_text = response_text.replace("```json", "").replace("```", "")
-        profile_data = json.loads(response_text)
-        return profile_data
+        return parse_profile_response(message)
         
     except Exception as e:
         logging.error(f"Error generating AI profile: {str(e)}")
         return None
 
+async def generate_ai_profiles_batch(content_list):
+    """Submit a Batch API job generating profiles for a list of (content_id, content) pairs"""
+    lines = []
+    for content_id, content in content_list:
+        lines.append(orjson.dumps({
+            "custom_id": str(content_id),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": PROFILE_MODEL,
+                "messages": build_profile_messages(content),
+                "prompt_cache_key": prompt_cache_key(content_id),
+                "response_format": PROFILE_RESPONSE_FORMAT
+            }
+        }))
+
+    batch_file = await client.files.create(
+        file=('ai_profiles_batch.jsonl', b'\n'.join(lines)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    logging.info(f"Submitted AI profile batch {batch.id} for {len(lines)} content items")
+    return batch
+
+async def retrieve_ai_profiles_batch(batch_id):
+    """Retrieve the status of a batch job"""
+    return await client.batches.retrieve(batch_id)
+
+async def fetch_ai_profiles_batch(batch_id):
+    """Retrieve a batch job and, once completed, its generated profiles keyed by content_id"""
+    batch = await retrieve_ai_profiles_batch(batch_id)
+    if batch.status != 'completed':
+        return batch, None
+    if not batch.output_file_id:
+        # Every request failed; the details are only in the batch's error file
+        logging.error(f"Batch {batch_id} completed without output, see error file {batch.error_file_id}")
+        return batch, {}
+
+    output = await client.files.content(batch.output_file_id)
+    profiles = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            result = orjson.loads(line)
+            response = result.get('response') or {}
+            if response.get('status_code') != 200:
+                logging.error(f"Batch {batch_id} request {result.get('custom_id')} failed: {result.get('error')}")
+                continue
+            message = response['body']['choices'][0]['message']
+            profiles[int(result['custom_id'])] = parse_profile_response(message)
+        except Exception as e:
+            logging.error(f"Error parsing batch {batch_id} result: {str(e)}")
+    return batch, profiles
+
+async def fetch_contents(content_ids, correlation_id=None):
+    """Fetch several content items concurrently"""
+    return await asyncio.gather(*[fetch_content(content_id, correlation_id) for content_id in content_ids])
+
 # API Models
 user_model = api.model('User', {
     'user_id': fields.Integer(required=True),
@@ -152,6 +409,52 @@ ai_model = api.model('AI', {
     'profile_pic_url': fields.String
 })
 
+ai_batch_model = api.model('AIBatch', {
+    'content_ids': fields.List(fields.Integer, required=True)
+})
+
+# Request body validators, compiled once at import. The API models above only
+# document the payloads for Swagger.
+OPTIONAL_STRING = {'type': ['string', 'null']}
+MAX_BATCH_CONTENT_IDS = 500
+
+validate_user = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['user_id', 'name'],
+    'properties': {
+        'user_id': {'type': 'integer'},
+        'display_name': OPTIONAL_STRING,
+        'name': {'type': 'string'},
+        'bio': OPTIONAL_STRING,
+        'location': OPTIONAL_STRING,
+        'profile_pic_url': OPTIONAL_STRING
+    }
+})
+
+validate_ai = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['content_id'],
+    'properties': {
+        'content_id': {'type': 'integer'},
+        'profile_pic_url': OPTIONAL_STRING
+    }
+})
+
+validate_ai_batch = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['content_ids'],
+    'properties': {
+        # custom_ids must be unique within a batch; the cap also bounds the concurrent content fetches
+        'content_ids': {
+            'type': 'array',
+            'items': {'type': 'integer'},
+            'minItems': 1,
+            'maxItems': MAX_BATCH_CONTENT_IDS,
+            'uniqueItems': True
+        }
+    }
+})
+
 @ns.route('/users')
 class UserResource(Resource):
     @api.doc('create_or_update_user')
@@ -159,32 +462,28 @@ class UserResource(Resource):
     def post(self):
         """Create or update a user profile"""
         try:
-            data = request.json
+            data = request.get_json(silent=True)
+            try:
+                validate_user(data)
+            except fastjsonschema.JsonSchemaException as e:
+                return {'error': e.message}, 400
+
             user_id = data['user_id']
+            values = {field: data[field] for field in USER_FIELDS if field in data}
+            values['user_id'] = user_id
 
-            if user_id is None:
-                return {'error': 'User ID is required'}, 400
-            
-            user = User.query.get(user_id)
-            is_update = user is not None
-            
-            if not user:
-                user = User(user_id=user_id)
-            
-            user.display_name = data.get('display_name', user.display_name if is_update else None)
-            user.name = data.get('name', user.name if is_update else None)
-            user.bio = data.get('bio', user.bio if is_update else None)
-            user.location = data.get('location', user.location if is_update else None)
-            user.profile_pic_url = data.get('profile_pic_url', user.profile_pic_url if is_update else None)
-            
-            if not is_update:
-                db.session.add(user)
-            
-            db.session.commit()
+            stmt = mysql_insert(User).values(**values)
+            updates = {field: stmt.inserted[field] for field in values if field != 'user_id'}
+            stmt = stmt.on_duplicate_key_update(**(updates or {'user_id': stmt.inserted.user_id}))
+            with upsert_engine.begin() as conn:
+                result = conn.execute(stmt)
+
+            # 1 affected row for an insert; 2 for a changed or 0 for an unchanged update
+            is_update = result.rowcount != 1
             
             return {
                 'message': f'User profile {"updated" if is_update else "created"} successfully',
-                'user_id': user.user_id,
+                'user_id': user_id,
                 'action': 'updated' if is_update else 'created'
             }, 200 if is_update else 201
             
@@ -200,76 +499,166 @@ class AIResource(Resource):
     def post(self):
         """Create or update an AI profile based on content"""
         try:
-            data = request.json
+            data = request.get_json(silent=True)
+            try:
+                validate_ai(data)
+            except fastjsonschema.JsonSchemaException as e:
+                return {'error': e.message}, 400
+
             content_id = data['content_id']
             correlation_id = request.headers.get('X-Correlation-ID')
-
-            if content_id is None:
-                return {'error': 'Content ID is required'}, 400
-            
-            ai = AI.query.filter_by(content_id=content_id).first()
-            is_update = ai is not None
-            
-            headers = {'X-API-KEY': API_KEY}
-            if correlation_id:
-                headers['X-Correlation-ID'] = correlation_id
-                
-            content_response = requests.get(f'{QUERY_API_URL}/api/content/{content_id}', headers=headers)
-            if content_response.status_code != 200:
+            content = async_runtime.run(fetch_content(content_id, correlation_id), UPSTREAM_TIMEOUT)
+            if content is None:
                 return {'error': 'Content not found'}, 404
-            
-            content = content_response.json()
                 
-            profile_data = generate_ai_profile(content, correlation_id)
+            profile_data = get_ai_profile(content_id, content, correlation_id)
             if not profile_data:
                 return {'error': 'Failed to generate AI profile'}, 500
                 
-            if not ai:
-                ai = AI(content_id=content_id)
-            
-            ai.display_name = profile_data.get('display_name', ai.display_name if is_update else None)
-            ai.name = profile_data.get('name', ai.name if is_update else None)
-            ai.bio = profile_data.get('bio', ai.bio if is_update else None)
-            ai.location = profile_data.get('location', ai.location if is_update else None)
-            ai.systems_instructions = profile_data.get('systems_instructions', ai.systems_instructions if is_update else None)
-            ai.profile_pic_url = data.get('profile_pic_url', ai.profile_pic_url if is_update else None)
-            
-            if not is_update:
-                db.session.add(ai)
-            
-            db.session.commit()
+            values = {field: profile_data[field] for field in AI_PROFILE_FIELDS if field in profile_data}
+            if 'profile_pic_url' in data:
+                values['profile_pic_url'] = data['profile_pic_url']
+            values['content_id'] = content_id
+
+            stmt = mysql_insert(AI).values(**values)
+            # LAST_INSERT_ID(ai_id) makes lastrowid return the existing id on update
+            stmt = stmt.on_duplicate_key_update(
+                ai_id=func.last_insert_id(AI.ai_id),
+                **{field: stmt.inserted[field] for field in values if field != 'content_id'}
+            )
+            with upsert_engine.begin() as conn:
+                result = conn.execute(stmt)
+
+            is_update = result.rowcount != 1
             
             return {
                 'message': f'AI profile {"updated" if is_update else "created"} successfully',
-                'ai_id': ai.ai_id,
-                'content_id': ai.content_id,
+                'ai_id': result.lastrowid,
+                'content_id': content_id,
                 'action': 'updated' if is_update else 'created'
             }, 200 if is_update else 201
             
+        except TimeoutError:
+            logging.error(f"Timed out creating/updating AI profile for content {content_id}")
+            return {'error': 'AI profile generation timed out'}, 504
         except Exception as e:
             db.session.rollback()
             logging.error(f"Error creating/updating AI profile: {str(e)}")
             return {'error': 'Internal server error'}, 500
 
+@ns.route('/ais/batch')
+class AIBatchResource(Resource):
+    @api.doc('create_ai_batch')
+    @api.expect(ai_batch_model)
+    def post(self):
+        """Submit a Batch API job generating AI profiles for many content items"""
+        try:
+            data = request.get_json(silent=True)
+            try:
+                validate_ai_batch(data)
+            except fastjsonschema.JsonSchemaException as e:
+                return {'error': e.message}, 400
+
+            content_ids = data['content_ids']
+            correlation_id = request.headers.get('X-Correlation-ID')
+
+            contents = async_runtime.run(fetch_contents(content_ids, correlation_id), UPSTREAM_TIMEOUT)
+            content_list = [(content_id, content) for content_id, content in zip(content_ids, contents) if content is not None]
+            missing_content_ids = [content_id for content_id, content in zip(content_ids, contents) if content is None]
+
+            if not content_list:
+                return {'error': 'Content not found'}, 404
+
+            batch = async_runtime.run(generate_ai_profiles_batch(content_list), UPSTREAM_TIMEOUT)
+
+            return {
+                'message': 'AI profile batch submitted successfully',
+                'batch_id': batch.id,
+                'status': batch.status,
+                'content_ids': [content_id for content_id, _ in content_list],
+                'missing_content_ids': missing_content_ids
+            }, 202
+
+        except Exception as e:
+            logging.error(f"Error submitting AI profile batch: {str(e)}")
+            return {'error': 'Internal server error'}, 500
+
+@ns.route('/ais/batch/<string:batch_id>')
+class AIBatchByIdResource(Resource):
+    @api.doc('get_ai_batch')
+    def get(self, batch_id):
+        """Get the status of a batch job"""
+        try:
+            batch = async_runtime.run(retrieve_ai_profiles_batch(batch_id), UPSTREAM_TIMEOUT)
+            ingested = db.session.get(AIBatch, batch_id) is not None
+
+            return {
+                'batch_id': batch.id,
+                'status': batch.status,
+                'ingested': ingested,
+                'error_file_id': batch.error_file_id
+            }, 200
+
+        except NotFoundError:
+            return {'error': 'Batch not found'}, 404
+        except Exception as e:
+            logging.error(f"Error getting AI profile batch: {str(e)}")
+            return {'error': 'Internal server error'}, 500
+
+    @api.doc('ingest_ai_batch')
+    def post(self, batch_id):
+        """Persist the AI profiles of a completed batch job, once"""
+        try:
+            if db.session.get(AIBatch, batch_id) is not None:
+                return {'error': 'Batch already ingested'}, 409
+
+            batch, profiles = async_runtime.run(fetch_ai_profiles_batch(batch_id), UPSTREAM_TIMEOUT)
+            if profiles is None:
+                return {'error': 'Batch not completed', 'status': batch.status}, 409
+
+            # Claiming the batch row serializes concurrent ingests of the same batch
+            claim = db.session.execute(mysql_insert(AIBatch).values(batch_id=batch_id).prefix_with('IGNORE'))
+            if claim.rowcount != 1:
+                db.session.rollback()
+                return {'error': 'Batch already ingested'}, 409
+
+            if profiles:
+                stmt = mysql_insert(AI).values([
+                    {'content_id': content_id, **{field: profile_data[field] for field in AI_PROFILE_FIELDS}}
+                    for content_id, profile_data in profiles.items()
+                ])
+                stmt = stmt.on_duplicate_key_update(
+                    **{field: stmt.inserted[field] for field in AI_PROFILE_FIELDS}
+                )
+                db.session.execute(stmt)
+            db.session.commit()
+
+            return {
+                'message': 'AI profile batch ingested successfully',
+                'batch_id': batch.id,
+                'status': batch.status,
+                'content_ids': list(profiles),
+                'error_file_id': batch.error_file_id
+            }, 200
+
+        except NotFoundError:
+            return {'error': 'Batch not found'}, 404
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Error ingesting AI profile batch: {str(e)}")
+            return {'error': 'Internal server error'}, 500
+
 @ns.route('/users/<int:user_id>')
 class UserByIdResource(Resource):
     @api.doc('get_user')
     def get(self, user_id):
         """Get user profile by user_id"""
         try:
-            user = User.query.get(user_id)
-            if not user:
+            row = db.session.execute(USER_PROFILE_QUERY.where(User.user_id == user_id)).mappings().first()
+            if not row:
                 return {'error': 'User not found'}, 404
                 
-            return {
-                'user_id': user.user_id,
-                'display_name': user.display_name,
-                'name': user.name,
-                'bio': user.bio,
-                'location': user.location,
-                'profile_pic_url': user.profile_pic_url,
-                'created_at': user.created_at.isoformat()
-            }, 200
+            return dict(row), 200
             
         except Exception as e:
             logging.error(f"Error getting user profile: {str(e)}")
@@ -281,21 +670,11 @@ class AIByContentResource(Resource):
     def get(self, content_id):
         """Get AI profile by content_id"""
         try:
-            ai = AI.query.filter_by(content_id=content_id).first()
-            if not ai:
+            row = db.session.execute(AI_PROFILE_QUERY.where(AI.content_id == content_id)).mappings().first()
+            if not row:
                 return {'error': 'AI profile not found'}, 404
                 
-            return {
-                'ai_id': ai.ai_id,
-                'content_id': ai.content_id,
-                'display_name': ai.display_name,
-                'name': ai.name,
-                'bio': ai.bio,
-                'location': ai.location,
-                'profile_pic_url': ai.profile_pic_url,
-                'systems_instructions': ai.systems_instructions,
-                'created_at': ai.created_at.isoformat()
-            }, 200
+            return dict(row), 200
             
         except Exception as e:
             logging.error(f"Error getting AI profile: {str(e)}")
@@ -307,19 +686,24 @@ def log_request_info():
     if request.path.startswith('/docs') or request.path.startswith('/swagger'):
         return
 
-    logging.info(f"Headers: {request.headers}")
-    logging.info(f"Body: {request.get_data()}")
+    logging.info(f"{request.method} {request.path}")
+    # Dumping headers and reading the full body is only worth it when debugging
+    # (logged at INFO, since the root logger drops DEBUG records)
+    if app.debug:
+        logging.info(f"Headers: {request.headers}")
+        logging.info(f"Body: {request.get_data()}")
 
     if 'X-API-KEY' not in request.headers:
         logging.warning("No X-API-KEY header")
         return jsonify({'error': 'No X-API-KEY'}), 401
     
-    x_api_key = request.headers.get('X-API-KEY')
-    if x_api_key != API_KEY:
+    x_api_key = request.headers.get('X-API-KEY', '').encode('utf-8')
+    if not API_KEY_BYTES or not hmac.compare_digest(x_api_key, API_KEY_BYTES):
         logging.warning("Invalid X-API-KEY")
         return jsonify({'error': 'Invalid X-API-KEY'}), 401
     else:
         return
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=C_PORT)
\ No newline at end of file
+    # Local development only; production runs under gunicorn (see gunicorn_conf.py)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=C_PORT)
\ No newline at end of file
@@ -0,0 +1,48 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import aiohttp
+import orjson
+
+_loop = None
+_loop_lock = threading.Lock()
+_http_session = None
+HTTP_CONNECTION_LIMIT = 200
+
+def get_loop():
+    """Return the shared background event loop, starting it on first use"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='async-runtime', daemon=True)
+                thread.start()
+                _loop = loop
+    return _loop
+
+def run(coro, timeout=None):
+    """Run a coroutine on the shared loop and block the calling thread for its result.
+
+    On timeout the coroutine is cancelled and TimeoutError is raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj).decode('utf-8')
+
+async def get_http_session():
+    """Shared aiohttp session bound to the background loop"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT),
+            json_serialize=_orjson_dumps
+        )
+    return _http_session
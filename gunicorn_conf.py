@@ -0,0 +1,27 @@
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Threaded workers: handlers block on the shared asyncio runtime (see
+# async_runtime.py), which multiplexes the outbound IO, so gevent monkey
+# patching is neither needed nor compatible with that loop thread.
+worker_class = 'gthread'
+
+# Every worker process runs its own ProfileWorkerPool, so the account-wide
+# OPENAI_RPM and OPENAI_MAX_CONCURRENCY limits are split evenly between workers
+# (app.py reads GUNICORN_WORKERS). Keep the process count low and scale with
+# threads instead: outbound IO is already multiplexed on each worker's loop.
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 64))
+os.environ['GUNICORN_WORKERS'] = str(workers)
+
+# With gthread workers the main loop heartbeats every second regardless of what
+# handler threads are doing, so this only detects a wedged worker process. It does
+# not bound requests; app.py puts deadlines on each async_runtime.run call.
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# No gunicorn access log: app.py's before_request hook already logs each request line
+errorlog = '-'
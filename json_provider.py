@@ -0,0 +1,22 @@
+import orjson
+from flask import make_response
+from flask.json.provider import JSONProvider
+
+# orjson serializes datetimes natively, so only non-str dict keys need an option
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX representation serializing resource responses with orjson"""
+    response = make_response(orjson.dumps(data, option=ORJSON_OPTIONS), code)
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = 'application/json'
+    return response
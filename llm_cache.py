@@ -0,0 +1,72 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import orjson
+import redis
+
+DEFAULT_TTL = 86400
+CONTENT_FIELDS = ('title', 'author', 'topic', 'genre', 'custom_prompt')
+
+_redis_client = None
+_local_cache = OrderedDict()
+_local_lock = threading.Lock()
+LOCAL_CACHE_MAX_SIZE = 1024
+
+def init_cache(redis_url=None):
+    """Configure the Redis backend; without a URL only the in-memory cache is used"""
+    global _redis_client
+    if redis_url:
+        pool = redis.ConnectionPool.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        _redis_client = redis.Redis(connection_pool=pool)
+    else:
+        _redis_client = None
+
+def cache_key(model, content, prompt_version=None):
+    """Deterministic key for a generation request"""
+    payload = {'model': model, 'prompt_version': prompt_version}
+    for field in CONTENT_FIELDS:
+        payload[field] = content.get(field)
+    return 'ai-profile:' + hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _local_get(key):
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _local_cache[key]
+            return None
+        _local_cache.move_to_end(key)
+        return value
+
+def _local_set(key, value, ttl):
+    with _local_lock:
+        _local_cache[key] = (time.monotonic() + ttl, value)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_MAX_SIZE:
+            _local_cache.popitem(last=False)
+
+def get_cached(key):
+    """Return the cached profile for key, or None on miss"""
+    if _redis_client is not None:
+        try:
+            cached = _redis_client.get(key)
+            return orjson.loads(cached) if cached else None
+        except (redis.exceptions.RedisError, ValueError) as e:
+            logging.warning(f"LLM cache read failed, falling back to local cache: {str(e)}")
+    return _local_get(key)
+
+def set_cached(key, value, ttl=DEFAULT_TTL):
+    """Store a generated profile under key"""
+    if _redis_client is not None:
+        try:
+            _redis_client.setex(key, ttl, orjson.dumps(value))
+            return
+        except redis.exceptions.RedisError as e:
+            logging.warning(f"LLM cache write failed, falling back to local cache: {str(e)}")
+    _local_set(key, value, ttl)
@@ -0,0 +1,6 @@
+-- One AI profile per content item; also serves as the index for content_id lookups.
+-- Remove duplicate rows first, keeping the most recent profile per content_id.
+DELETE a FROM ais a
+JOIN ais b ON a.content_id = b.content_id AND a.ai_id < b.ai_id;
+
+ALTER TABLE ais ADD CONSTRAINT uq_ais_content_id UNIQUE (content_id);
@@ -0,0 +1,6 @@
+-- created_at is now filled in by the database instead of the application.
+UPDATE users SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL;
+ALTER TABLE users MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+UPDATE ais SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL;
+ALTER TABLE ais MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP;
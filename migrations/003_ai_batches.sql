@@ -0,0 +1,5 @@
+-- Batch API jobs whose profiles have been written to ais, so each is ingested once.
+CREATE TABLE ai_batches (
+    batch_id VARCHAR(64) NOT NULL PRIMARY KEY,
+    ingested_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
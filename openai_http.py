@@ -0,0 +1,57 @@
+import aiohttp
+import orjson
+
+import async_runtime
+
+OPENAI_API_BASE = 'https://api.openai.com/v1'
+DEFAULT_TIMEOUT = 120
+CONNECT_TIMEOUT = 5
+# Same statuses the OpenAI SDK retries
+RETRYABLE_STATUSES = (408, 409, 429)
+
+class OpenAIHTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"OpenAI request failed ({status}): {message}")
+        self.status = status
+
+class OpenAIRetryableError(OpenAIHTTPError):
+    """Transient failure (timeout, conflict, rate limit or 5xx) worth retrying"""
+    pass
+
+class OpenAIRateLimitError(OpenAIRetryableError):
+    pass
+
+async def _error_message(response):
+    text = await response.text()
+    try:
+        return orjson.loads(text).get('error', {}).get('message') or text[:200]
+    except (ValueError, AttributeError):
+        return text[:200]
+
+class ChatCompletionsClient:
+    """Minimal chat completions client posting directly over the shared aiohttp session.
+
+    Bypasses the SDK's httpx transport, which degrades under high concurrency.
+    Returns the decoded JSON response body.
+    """
+
+    def __init__(self, api_key, base_url=OPENAI_API_BASE, timeout=DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Authorization': f'Bearer {api_key}'}
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=CONNECT_TIMEOUT)
+
+    async def create(self, **payload):
+        session = await async_runtime.get_http_session()
+        async with session.post(
+            f'{self.base_url}/chat/completions',
+            json=payload,
+            headers=self.headers,
+            timeout=self.timeout
+        ) as response:
+            if response.status == 429:
+                raise OpenAIRateLimitError(response.status, await _error_message(response))
+            if response.status in RETRYABLE_STATUSES or response.status >= 500:
+                raise OpenAIRetryableError(response.status, await _error_message(response))
+            if response.status != 200:
+                raise OpenAIHTTPError(response.status, await _error_message(response))
+            return await response.json(content_type=None, loads=orjson.loads)
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import random
+
+from aiolimiter import AsyncLimiter
+from openai import RateLimitError
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_REQUESTS_PER_MINUTE = 500
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+
+class ProfileWorkerPool:
+    """Queue of chat completion requests drained by a fixed set of worker tasks.
+
+    `create` is the coroutine function performing the request. The number of workers
+    bounds in-flight OpenAI calls and the limiter keeps the request rate under the
+    account's RPM limit. Must be used from a single event loop.
+    """
+
+    def __init__(self, create, max_concurrency=DEFAULT_MAX_CONCURRENCY, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE,
+                 retry_on=(RateLimitError,)):
+        self.create = create
+        self.retry_on = retry_on
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self._queue = None
+        self._limiter = None
+        self._workers = []
+
+    def _ensure_started(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._limiter = AsyncLimiter(self.requests_per_minute, 60)
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)]
+
+    async def submit(self, **request_kwargs):
+        """Queue a chat completion request and wait for its response"""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request_kwargs, future))
+        return await future
+
+    async def _worker(self):
+        while True:
+            request_kwargs, future = await self._queue.get()
+            try:
+                if future.cancelled():
+                    continue
+                response = await self._create_with_retry(request_kwargs)
+                if not future.done():
+                    future.set_result(response)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _create_with_retry(self, request_kwargs):
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                async with self._limiter:
+                    return await self.create(**request_kwargs)
+            except self.retry_on as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                delay = BACKOFF_BASE_SECONDS * 2 ** attempt + random.uniform(0, 1)
+                logging.warning(f"OpenAI request failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
@@ -1,8 +1,66 @@
 import boto3
+import functools
 import json
 import os
+import stat
+import tempfile
+import time
 from botocore.exceptions import ClientError
 
+# Secrets are cached on disk so each gunicorn worker doesn't call Secrets Manager at import.
+# The cache lives in a per-user 0700 directory and files are only trusted when they are
+# owned by the current user and not accessible to anyone else.
+SECRETS_CACHE_DIR = os.environ.get(
+    'SECRETS_CACHE_DIR', os.path.join(tempfile.gettempdir(), f'gnosis-secrets-{os.getuid()}')
+)
+SECRETS_CACHE_TTL = int(os.environ.get('SECRETS_CACHE_TTL', 300))
+
+def _is_private(st):
+    return st.st_uid == os.getuid() and st.st_mode & 0o077 == 0
+
+def _cache_dir():
+    try:
+        os.mkdir(SECRETS_CACHE_DIR, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(SECRETS_CACHE_DIR)
+    if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+        raise PermissionError(f"Secrets cache directory {SECRETS_CACHE_DIR} is not private to this user")
+    return SECRETS_CACHE_DIR
+
+def _cache_path(service_name):
+    return os.path.join(_cache_dir(), f'{service_name}_secrets_cache.json')
+
+def _read_cached_secrets(service_name):
+    try:
+        fd = os.open(_cache_path(service_name), os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return None
+    with os.fdopen(fd) as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or not _is_private(st):
+            return None
+        if time.time() - st.st_mtime > SECRETS_CACHE_TTL:
+            return None
+        try:
+            return json.load(f)
+        except ValueError:
+            return None
+
+def _write_cached_secrets(service_name, secrets):
+    try:
+        path = _cache_path(service_name)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(secrets, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
 def get_secrets(secret_name="gnosis-secrets", region_name="us-east-1"):        
     session = boto3.session.Session()
     client = session.client(
@@ -18,6 +76,13 @@ def get_secrets(secret_name="gnosis-secrets", region_name="us-east-1"):
     except ClientError as e:
         raise e
 
+@functools.lru_cache(maxsize=None)
 def get_service_secrets(service_name):
-    secrets = get_secrets()
-    return secrets.get(service_name, {})
\ No newline at end of file
+    # Only this service's subset is cached, never the shared blob
+    cached = _read_cached_secrets(service_name)
+    if cached is not None:
+        return cached
+
+    secrets = get_secrets().get(service_name, {})
+    _write_cached_secrets(service_name, secrets)
+    return secrets
@@ -1,4 +1,6 @@
 import requests
+import asyncio
+import aiohttp
 import logging
 from pprint import pprint
 from datetime import datetime
@@ -60,42 +62,45 @@ def test_user_profile():
     except Exception as e:
         logging.error(f"Error in user profile test: {str(e)}")
 
-def test_ai_profile_creation():
+async def create_and_fetch_ai_profile(session, content_id):
+    """Create the AI profile for one content ID, then retrieve it"""
+    logging.info(f"\nTesting AI Profile Creation for Content ID {content_id}:")
+    try:
+        # Create AI profile
+        async with session.post(
+            f"{PROFILE_SERVICE_URL}/api/ais",
+            json={'content_id': content_id}
+        ) as response:
+            body = await response.json()
+            created = response.status == 201 or response.status == 200
+
+        if created:
+            logging.info(f"AI profile created successfully for content {content_id}")
+            logging.info(f"Response: {body}")
+
+            # Get AI profile
+            async with session.get(f"{PROFILE_SERVICE_URL}/api/ais/content/{content_id}") as response:
+                logging.info(f"Response Status Code: {response.status}")
+                body = await response.json()
+                if response.status == 200 or response.status == 201:
+                    logging.info(f"\nRetrieved AI Profile for content {content_id}:")
+                    pprint(body)
+                else:
+                    logging.error(f"Failed to retrieve AI profile: {body}")
+        else:
+            logging.error(f"Failed to create AI profile: {body}")
+
+    except Exception as e:
+        logging.error(f"Error in AI profile test for content {content_id}: {str(e)}")
+
+async def test_ai_profile_creation():
     """Test AI profile creation and retrieval for specific content"""
     
-    # Test with content IDs 29 and 30
+    # Test with content IDs 12 and 13, all created concurrently
     content_ids = [12, 13]
     
-    for content_id in content_ids:
-        logging.info(f"\nTesting AI Profile Creation for Content ID {content_id}:")
-        try:
-            # Create AI profile
-            response = requests.post(
-                f"{PROFILE_SERVICE_URL}/api/ais",
-                json={'content_id': content_id},
-                headers={'X-API-KEY': API_KEY}
-            )
-            
-            if response.status_code == 201 or response.status_code == 200:
-                logging.info(f"AI profile created successfully for content {content_id}")
-                logging.info(f"Response: {response.json()}")
-                
-                # Get AI profile
-                response = requests.get(
-                    f"{PROFILE_SERVICE_URL}/api/ais/content/{content_id}",
-                    headers={'X-API-KEY': API_KEY}
-                )
-                logging.info(f"Response Status Code: {response.status_code}")
-                if response.status_code == 200 or response.status_code == 201:
-                    logging.info(f"\nRetrieved AI Profile for content {content_id}:")
-                    pprint(response.json())
-                else:
-                    logging.error(f"Failed to retrieve AI profile: {response.json()}")
-            else:
-                logging.error(f"Failed to create AI profile: {response.json()}")
-                
-        except Exception as e:
-            logging.error(f"Error in AI profile test for content {content_id}: {str(e)}")
+    async with aiohttp.ClientSession(headers={'X-API-KEY': API_KEY}) as session:
+        await asyncio.gather(*[create_and_fetch_ai_profile(session, content_id) for content_id in content_ids])
 
 def test_ai_profile_retrieval():
     """Test retrieving existing AI profiles"""
@@ -132,7 +137,7 @@ def run_tests():
     test_user_profile()
     
     logging.info("\n=== Testing AI Profile Creation ===")
-    test_ai_profile_creation()
+    asyncio.run(test_ai_profile_creation())
     
     logging.info("\n=== Testing AI Profile Retrieval ===")
     test_ai_profile_retrieval()